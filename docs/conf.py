@@ -8,11 +8,13 @@
 import os
 import sys
 import csv
+import hashlib
+import io
+from itertools import repeat
 from pathlib import Path
 
 # The full version, including alpha/beta/rc tags
 from sammi import __version__
-from sammi.cdf_attribute_manager import CdfAttributeManager
 
 sys.path.insert(0, os.path.abspath(".."))
 # -- Project information -----------------------------------------------------
@@ -47,39 +49,103 @@ extensions = [
 automodapi_toctreedirnm = "generated/api"
 
 # -- Generate CSV Files for Docs ---------------------------------------------
-if not os.path.exists("generated"):
-    os.mkdir("generated")  # generate the directory before putting things in it
+# The CSV tables are generated from the attribute schemas by
+# ``generate_attribute_csvs``, which runs on the ``builder-inited`` event (see
+# ``setup`` at the bottom of this file) rather than whenever this file is read.
+
+
+def write_if_changed(path: Path, new_bytes: bytes):
+    # Leave the file (and its mtime) alone when the content is unchanged, so
+    # Sphinx does not treat the pages that include it as outdated
+    if (
+        path.exists()
+        and path.stat().st_size == len(new_bytes)
+        and path.read_bytes() == new_bytes
+    ):
+        return
+    path.write_bytes(new_bytes)
 
 
 def to_csv(info: dict, path: Path):
-    # Get Header
-    header_set = set()
-    for attr_details in info.values():
-        header_set.update(attr_details.keys())
-    headers = ["Attribute"] + sorted(header_set)
-
-    # Open the output file in write mode
-    with open(path, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        # Write the header row
-        writer.writerow(headers)
-
-        # Iterate over the dictionary and write each row
-        for attr_name, attr_details in info.items():
-            row = [attr_name]
-            for key in headers[1:]:  # Skip "Attribute" which is already added
-                row.append(attr_details.get(key, ""))
-            # Write the row to the CSV
-            writer.writerow(row)
-
-
-# Global Attributes to CSV
-global_info = CdfAttributeManager().global_attribute_info()
-to_csv(global_info, Path("./generated/global_attributes.csv"))
-
-# Variable Attributes to CSV
-variable_info = CdfAttributeManager().variable_attribute_info()
-to_csv(variable_info, Path("./generated/variable_attributes.csv"))
+    # Get Header, sorted so the column order is reproducible between builds
+    headers = ["Attribute"] + sorted(set().union(*info.values()))
+    keys = headers[1:]  # Skip "Attribute" which is filled from the dict key
+
+    # Serialize the table in memory so it can be compared to the existing file
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    # Write the header row
+    writer.writerow(headers)
+
+    # Write all attribute rows in a single pass through the C writer, building
+    # each row as one tuple with missing columns left empty
+    writer.writerows(
+        (attr_name, *map(attr_details.get, keys, repeat("")))
+        for attr_name, attr_details in info.items()
+    )
+
+    write_if_changed(path, buf.getvalue().encode("utf-8"))
+
+
+def schema_hash(confdir: Path) -> str:
+    # Hash everything the generated tables depend on: the default schemas, the
+    # code that turns them into tables, and this file
+    import sammi
+
+    sammi_dir = Path(sammi.__file__).parent
+    digest = hashlib.sha256()
+    for path in [
+        confdir / "conf.py",
+        sammi_dir / "cdf_attribute_manager.py",
+        *sorted((sammi_dir / "data").glob("*.yaml")),
+    ]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def generate_attribute_csvs(app):
+    generated_dir = Path(app.confdir) / "generated"
+    csv_paths = [
+        generated_dir / "global_attributes.csv",
+        generated_dir / "variable_attributes.csv",
+    ]
+
+    # Builders that do not produce HTML (linkcheck, gettext, man, ...) still read
+    # the csv-table directives, but any existing tables are good enough for them
+    if app.builder.format != "html" and all(path.exists() for path in csv_paths):
+        return
+
+    # Skip regenerating the tables when their inputs have not changed since
+    # the last build (or since they were restored from the CI cache)
+    stamp_path = generated_dir / ".schema_hash"
+    current_hash = schema_hash(Path(app.confdir))
+    if (
+        all(path.exists() for path in csv_paths)
+        and stamp_path.exists()
+        and stamp_path.read_text() == current_hash
+    ):
+        return
+
+    # Imported here so only builds that generate the tables pay for loading
+    # and parsing the attribute schemas
+    from sammi.cdf_attribute_manager import CdfAttributeManager
+
+    # generate the directory before putting things in it
+    generated_dir.mkdir(exist_ok=True)
+
+    # Load the schemas once and reuse the manager for both tables
+    cdf_attr_manager = CdfAttributeManager()
+
+    # Global Attributes to CSV
+    global_info = cdf_attr_manager.global_attribute_info()
+    to_csv(global_info, csv_paths[0])
+
+    # Variable Attributes to CSV
+    variable_info = cdf_attr_manager.variable_attribute_info()
+    to_csv(variable_info, csv_paths[1])
+
+    stamp_path.write_text(current_hash)
+
 
 # Add any paths that contain templates here, relative to this directory.
 # templates_path = ['_templates']
@@ -146,3 +212,7 @@ graphviz_dot_args = [
     "-Gfontsize=10",
     "-Gfontname=Helvetica Neue, Helvetica, Arial, sans-serif",
 ]
+
+
+def setup(app):
+    app.connect("builder-inited", generate_attribute_csvs)
@@ -1,17 +1,112 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+import os
+import pickle
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import IO, Optional, Union
 import yaml
 
 import sammi
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 __all__ = ["CdfAttributeManager"]
 
+# Sentinel for keys missing from a layer, as None is a valid attribute value
+_MISSING = object()
+
+# Number of built schemas shared between managers
+_BUILT_SCHEMA_CACHE_SIZE = 32
+
+# Prefixes of variable attributes that are indexed per dimension, e.g. DEPEND_1
+_INDEXED_ATTR_PREFIXES = ("DEPEND_", "LABL_PTR_", "REPRESENTATION_")
+
 DEFAULT_GLOBAL_CDF_ATTRS_SCHEMA_FILE = "default_global_cdf_attrs_schema.yaml"
 DEFAULT_VARIABLE_CDF_ATTRS_SCHEMA_FILE = "default_variable_cdf_attrs_schema.yaml"
 
+# The Default Schema files are contained in the `sammi/data` directory
+DEFAULT_GLOBAL_CDF_ATTRS_SCHEMA_PATH = (
+    files(sammi) / "data" / DEFAULT_GLOBAL_CDF_ATTRS_SCHEMA_FILE
+)
+DEFAULT_VARIABLE_CDF_ATTRS_SCHEMA_PATH = (
+    files(sammi) / "data" / DEFAULT_VARIABLE_CDF_ATTRS_SCHEMA_FILE
+)
+
+
+def _intern_keys(data):
+    """
+    Return a copy of parsed yaml data with every string key interned.
+
+    Schemas and variable definitions reuse a small vocabulary of attribute names,
+    so interning lets all of them share one string object per name and lets dict
+    lookups succeed on identity before comparing characters.
+    """
+    if isinstance(data, dict):
+        return {
+            (sys.intern(key) if isinstance(key, str) else key): _intern_keys(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_intern_keys(item) for item in data]
+    return data
+
+
+def _freeze(data):
+    """
+    Return a read-only copy of a built schema, with every `dict` in it replaced by a
+    `MappingProxyType` view and every `list` by a `tuple`.
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(_freeze(item) for item in data)
+    return data
+
+
+def _stat_yaml_file(file_path) -> os.stat_result:
+    """
+    Stat a yaml file, raising a `FileNotFoundError` that names the file if missing.
+    """
+    try:
+        return os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Yaml file not found: {file_path}") from None
+
+
+def _schema_cache_path(file_path, file_stat: os.stat_result) -> Path:
+    """
+    Path of the pickled copy of a schema file, in the user's cache directory.
+
+    The cache lives under ``sammi/schemas`` in ``$XDG_CACHE_HOME`` (or ``~/.cache``),
+    so it works for read-only installs and is never shipped with the package.
+    The name is keyed on the path, modification time and size of the schema file,
+    so a changed file never matches an older pickle, even if its timestamp went
+    back, e.g. after installing a new release.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    file_key = (
+        f"{Path(file_path).resolve()}\0{file_stat.st_mtime_ns}\0{file_stat.st_size}"
+    )
+    file_digest = hashlib.blake2b(file_key.encode("utf-8"), digest_size=8)
+    return (
+        Path(cache_home)
+        / "sammi"
+        / "schemas"
+        / f"{Path(file_path).name}.{file_digest.hexdigest()}.pkl"
+    )
+
 
 class CdfAttributeManager:
     """
@@ -97,6 +192,25 @@ class CdfAttributeManager:
 
     """
 
+    __slots__ = (
+        "_global_attr_schema",
+        "_required_global_attrs",
+        "_required_global_attr_names",
+        "_use_defaults",
+        "_variable_schema_layers",
+        "_variable_attr_schema",
+        "_variable_attr_keys_schema",
+        "_variable_attr_names",
+        "_required_variable_attrs",
+        "_required_variable_attr_names",
+        "_attr_var_types",
+        "_variable_attributes",
+        "_global_attributes",
+        "_global_attr_info",
+        "_variable_attr_info",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         global_schema_layers: Optional[list[Path]] = None,
@@ -115,171 +229,422 @@ class CdfAttributeManager:
             )
 
         # Construct the Global Attribute Schema
-        _global_attr_schema = {}
-        if use_defaults:
-            _def_global_attr_schema = self._load_default_global_attr_schema()
-            _global_attr_schema = self._merge(
-                base_layer=_global_attr_schema, new_layer=_def_global_attr_schema
-            )
-        if global_schema_layers is not None:
-            for schema_layer_path in global_schema_layers:
-                _global_attr_layer = CdfAttributeManager._load_yaml_data(
-                    file_path=schema_layer_path
-                )
-                _global_attr_schema = self._merge(
-                    base_layer=_global_attr_schema, new_layer=_global_attr_layer
-                )
-        # Set Final Member
-        self._global_attr_schema = _global_attr_schema
-
-        # Data Validation and Compliance for Variable Data
-        _variable_attr_schema = {}
-        if use_defaults:
-            _def_variable_attr_schema = self._load_default_variable_attr_schema()
-            _variable_attr_schema = self._merge(
-                base_layer=_variable_attr_schema, new_layer=_def_variable_attr_schema
-            )
-        if variable_schema_layers is not None:
-            for schema_layer_path in variable_schema_layers:
-                _variable_attr_layer = CdfAttributeManager._load_yaml_data(
-                    file_path=schema_layer_path
-                )
-                _variable_attr_schema = self._merge(
-                    base_layer=_variable_attr_schema, new_layer=_variable_attr_layer
-                )
-        # Set the Final Member
-        self._variable_attr_schema = _variable_attr_schema
+        self._global_attr_schema = self._get_built_schema(
+            "global", use_defaults, global_schema_layers
+        )
+        # Required attribute names, in schema order
+        self._required_global_attrs = tuple(
+            attr_name
+            for attr_name, attr_schema in self._global_attr_schema.items()
+            if attr_schema.get("required")
+        )
+        self._required_global_attr_names = frozenset(self._required_global_attrs)
+
+        # The variable schema is only built once it is first needed, but missing
+        # layer files are reported here, where they were passed in
+        for schema_layer_path in variable_schema_layers or ():
+            _stat_yaml_file(schema_layer_path)
+        self._use_defaults = use_defaults
+        self._variable_schema_layers = (
+            list(variable_schema_layers) if variable_schema_layers is not None else None
+        )
+        self._variable_attr_schema: Optional[Mapping] = None
 
         self._variable_attributes: dict = {}
         self._global_attributes: dict = self._load_default_global_attributes()
 
+        # Attribute info tables, built on first request and reused afterwards
+        self._global_attr_info: Optional[Mapping] = None
+        self._variable_attr_info: Optional[Mapping] = None
+
     @property
-    def global_attribute_schema(self):
-        """(`dict`) Schema for variable attributes of the file."""
+    def global_attribute_schema(self) -> Mapping:
+        """(`Mapping`) Read-only view of the global attribute schema of the file, nested entries included."""
         return self._global_attr_schema
 
     @property
-    def variable_attribute_schema(self):
-        """(`dict`) Schema for variable attributes of the file."""
+    def variable_attribute_schema(self) -> Mapping:
+        """(`Mapping`) Read-only view of the variable attribute schema, nested entries included, built on first use."""
+        if self._variable_attr_schema is None:
+            self._load_variable_attr_schema()
         return self._variable_attr_schema
 
     # =========================================================================
     #                       INITIALIZATION FUNCTIONS
     # =========================================================================
 
-    def _load_default_global_attr_schema(self) -> dict:
+    def _load_variable_attr_schema(self) -> None:
+        """
+        Build the variable schema from its layers, along with the attribute names
+        derived from it.
+        """
+        _variable_attr_schema = self._get_built_schema(
+            "variable", self._use_defaults, self._variable_schema_layers
+        )
+        # Schemas of the individual variable attributes, which are looked up often
+        self._variable_attr_keys_schema = _variable_attr_schema["attribute_key"]
+        # Attribute names to look for in each variable, and which are required
+        self._variable_attr_names = list(self._variable_attr_keys_schema)
+        self._required_variable_attrs = tuple(
+            attr_name
+            for attr_name, attr_schema in self._variable_attr_keys_schema.items()
+            if attr_schema.get("required")
+        )
+        self._required_variable_attr_names = frozenset(self._required_variable_attrs)
+        # Which VAR_TYPE's require each attribute, in VAR_TYPE order
+        self._attr_var_types: dict[str, list[str]] = {}
+        for var_type in ["data", "support_data", "metadata"]:
+            for attr_name in _variable_attr_schema.get(var_type, []):
+                self._attr_var_types.setdefault(attr_name, []).append(var_type)
+        # Set the Final Member
+        self._variable_attr_schema = _variable_attr_schema
+
+    def _get_built_schema(
+        self,
+        kind: str,
+        use_defaults: Optional[bool],
+        schema_layers: Optional[list[Path]],
+    ) -> Mapping:
         """
-        Load the default global schema from the source directory.
+        Get the global or variable schema built from the given layers.
+
+        Built schemas are read-only and shared between instances created with the
+        same layers, and are only built again once one of the layer files changes
+        on disk.
+
+        Parameters
+        ----------
+        kind : `str`
+            Either "global" or "variable".
+        use_defaults : `bool`
+            Whether the default schema is the first layer.
+        schema_layers : `list[Path]`, optional
+            The paths of the schema layers to merge on top of the defaults.
 
         Returns
         -------
-        dict
-            The dict representing the global schema.
-        """
-        # The Default Schema file is contained in the `sammi/data` directory
-        default_schema_path = str(
-            Path(sammi.__file__).parent.parent
-            / "sammi"
-            / "data"
-            / DEFAULT_GLOBAL_CDF_ATTRS_SCHEMA_FILE
-        )
-        # Load the Schema
-        return CdfAttributeManager._load_yaml_data(file_path=default_schema_path)
+        Mapping
+            The built schema.
+        """
+        layer_paths = list(schema_layers or ())
+        if use_defaults:
+            layer_paths.insert(
+                0,
+                (
+                    DEFAULT_GLOBAL_CDF_ATTRS_SCHEMA_PATH
+                    if kind == "global"
+                    else DEFAULT_VARIABLE_CDF_ATTRS_SCHEMA_PATH
+                ),
+            )
+        # Each layer is identified by its path and the state of the file on disk
+        layer_files = []
+        for layer_path in layer_paths:
+            file_stat = _stat_yaml_file(layer_path)
+            layer_files.append(
+                (
+                    str(Path(layer_path).resolve()),
+                    file_stat.st_mtime_ns,
+                    file_stat.st_size,
+                )
+            )
+        return self._build_schema(kind, bool(use_defaults), tuple(layer_files))
 
-    def _load_default_variable_attr_schema(self) -> dict:
+    @staticmethod
+    @functools.lru_cache(maxsize=_BUILT_SCHEMA_CACHE_SIZE)
+    def _build_schema(
+        kind: str, use_defaults: bool, layer_files: tuple[tuple[str, int, int], ...]
+    ) -> Mapping:
         """
-        Load the default variable schema from the source directory.
+        Build the global or variable schema from its layer files, caching the result.
+
+        Parameters
+        ----------
+        kind : `str`
+            Either "global" or "variable".
+        use_defaults : `bool`
+            Whether the first layer is a default schema.
+        layer_files : `tuple[tuple[str, int, int], ...]`
+            The resolved path, modification time and size of each layer file, in
+            order, so that files edited on disk build a new schema.
 
         Returns
         -------
-        dict
-            The dict representing the variable schema.
-        """
-        # The Default Schema file is contained in the `sammi/data` directory
-        default_schema_path = str(
-            Path(sammi.__file__).parent.parent
-            / "sammi"
-            / "data"
-            / DEFAULT_VARIABLE_CDF_ATTRS_SCHEMA_FILE
+        Mapping
+            The built schema, frozen with `_freeze` as it is shared between callers.
+        """
+        layers = CdfAttributeManager._load_schema_layers(
+            [layer_path for layer_path, _, _ in layer_files], use_defaults
         )
-        # Load the Schema
-        return CdfAttributeManager._load_yaml_data(file_path=default_schema_path)
+        if kind == "global":
+            return _freeze(CdfAttributeManager._build_global_attr_schema(layers))
+        return _freeze(CdfAttributeManager._build_variable_attr_schema(layers))
+
+    @staticmethod
+    def _load_schema_layers(layer_paths: list[str], use_defaults: bool) -> list[dict]:
+        """
+        Load the schema layer files, in order.
+
+        The files are read on a thread pool when there are several of them, so
+        that waiting on the file system for one overlaps with reading the others.
+
+        Parameters
+        ----------
+        layer_paths : `list[str]`
+            The paths of the schema layers to load.
+        use_defaults : `bool`
+            Whether the first layer is a default schema, which can be loaded
+            through the pickle cache.
+
+        Returns
+        -------
+        list[dict]
+            The loaded layers.
+        """
+        loads = [
+            functools.partial(CdfAttributeManager._load_yaml_data, file_path=layer_path)
+            for layer_path in layer_paths
+        ]
+        if use_defaults:
+            loads[0] = functools.partial(
+                CdfAttributeManager._load_schema_data, file_path=layer_paths[0]
+            )
+
+        if len(loads) < 2:
+            return [load() for load in loads]
+        with ThreadPoolExecutor(max_workers=min(8, len(loads))) as executor:
+            futures = [executor.submit(load) for load in loads]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _build_global_attr_schema(layers: list[dict]) -> dict:
+        """
+        Merge the global schema layers, with descriptions stripped of new lines.
+        """
+        # Every layer is a fresh copy, so the first one can be used as the base
+        _global_attr_schema = layers[0]
+        for _global_attr_layer in layers[1:]:
+            _global_attr_schema = CdfAttributeManager._merge_schema_fast(
+                base_layer=_global_attr_schema, new_layer=_global_attr_layer
+            )
+        CdfAttributeManager._strip_descriptions(_global_attr_schema)
+        return _global_attr_schema
+
+    @staticmethod
+    def _build_variable_attr_schema(layers: list[dict]) -> dict:
+        """
+        Merge the variable schema layers, with descriptions stripped of new lines.
+        """
+        _variable_attr_schema = layers[0]
+        for _variable_attr_layer in layers[1:]:
+            _variable_attr_schema = CdfAttributeManager._merge(
+                base_layer=_variable_attr_schema, new_layer=_variable_attr_layer
+            )
+        CdfAttributeManager._strip_descriptions(_variable_attr_schema["attribute_key"])
+        # Layers extend the VAR_TYPE lists, so keep only the first listing of each
+        # attribute, in order
+        for var_type in ["data", "support_data", "metadata"]:
+            var_type_attrs = _variable_attr_schema.get(var_type)
+            if type(var_type_attrs) is list:
+                _variable_attr_schema[var_type] = list(dict.fromkeys(var_type_attrs))
+        return _variable_attr_schema
 
     def _load_default_global_attributes(self) -> dict:
         # Use the Existing Global Schema
-        global_schema = self.global_attribute_schema
+        global_schema = self._global_attr_schema
+        # Attributes without a default in the schema have no default value
         return {
-            attr_name: info["default"]
+            attr_name: default
             for attr_name, info in global_schema.items()
-            if info["default"] is not None
+            if (default := info.get("default")) is not None
         }
 
     @staticmethod
-    def _load_yaml_data(file_path: Path) -> dict:
+    def _load_schema_data(file_path: Path) -> dict:
         """
-        Load a yaml file from the provided path.
+        Load a schema yaml file, optionally through a pickled copy of the file.
+
+        When the ``SAMMI_SCHEMA_CACHE`` environment variable is set to ``1``, the
+        parsed schema is pickled into the user's cache directory (see
+        `_schema_cache_path`) and loaded from there by later processes, as long as
+        the yaml file is unchanged. Otherwise this is the same as `_load_yaml_data`.
 
         Parameters
         ----------
         file_path : `Path`
-            Path to the yaml file to load.
+            Path to the schema yaml file to load.
+
+        Returns
+        -------
+        dict
+            Loaded schema.
+        """
+        if os.environ.get("SAMMI_SCHEMA_CACHE") != "1":
+            return CdfAttributeManager._load_yaml_data(file_path)
+
+        try:
+            cache_path = _schema_cache_path(file_path, _stat_yaml_file(file_path))
+        except RuntimeError:
+            # No home directory to keep the cache in
+            return CdfAttributeManager._load_yaml_data(file_path)
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # Missing or unreadable cache, fall back to parsing the yaml file
+            pass
+
+        schema = CdfAttributeManager._load_yaml_data(file_path)
+        # The cache is best-effort, e.g. the cache directory may be read-only
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = Path(f"{cache_path}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(schema, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Swap the complete file into place so readers never see a partial one
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            logging.debug(f"Could not write schema cache file {cache_path}")
+        return schema
+
+    @staticmethod
+    def _strip_descriptions(attr_schemas: dict) -> None:
+        """
+        Strip the descriptions of a set of attribute schemas of new lines.
+
+        This is done once when the schema is created, so the info functions can
+        return the descriptions as-is.
+
+        Parameters
+        ----------
+        attr_schemas : `dict`
+            Mapping of attribute names to attribute schemas, updated in-place.
+        """
+        for attr_schema in attr_schemas.values():
+            description = attr_schema.get("description")
+            if isinstance(description, str):
+                attr_schema["description"] = description.strip()
+
+    @staticmethod
+    def _load_yaml_data(file_path: Union[Path, IO]) -> dict:
+        """
+        Load a yaml file from the provided path.
+
+        Parameters
+        ----------
+        file_path : `Path` or file-like
+            Path to the yaml file to load, or an open stream to read the yaml from.
 
         Returns
         -------
         dict
             Loaded yaml.
+
+        Raises
+        ------
+        FileNotFoundError: If there is no file at file_path.
         """
-        assert Path(file_path).exists()
+        if hasattr(file_path, "read"):
+            return _intern_keys(yaml.load(file_path, Loader=SafeLoader))
+
         # Load the Yaml file to Dict
-        yaml_data = {}
-        with open(file_path, "r") as f:
-            yaml_data = yaml.safe_load(f)
-        return yaml_data
+        _stat_yaml_file(file_path)
+        with open(file_path, "rb") as f:
+            return _intern_keys(yaml.load(f, Loader=SafeLoader))
 
-    def _merge(self, base_layer: dict, new_layer: dict, path: list = None) -> None:
+    @staticmethod
+    def _merge(base_layer: dict, new_layer: dict) -> dict:
         """
         Function to do in-place merging and updating of two dictionaries.
         This is an improvemnent over the built-in dict.update() method, as it allows for nested dictionaries and lists.
 
+        Nested dictionaries are merged with an explicit stack rather than through
+        recursion, so deeply nested layers do not pay for a Python call per level.
+        Only plain `dict` and `list` values, which is all yaml produces, are merged;
+        instances of their subclasses are treated like scalars.
+
         Parameters
         ----------
         base_layer : `dict`
             The base dictionary to merge into.
         new_layer : `dict`
             The new dictionary to merge into the base.
-        path : `list`
-            The path to the current dictionary being merged. Used for recursion.
 
         Returns
         -------
-        None - operation is done in-place.
-        """
-        # If we are at the top of the recursion, and we don't have a path, create a new one
-        if not path:
-            path = []
-        # for each key in the base layer
-        for key in new_layer:
-            # If its a shared key
-            if key in base_layer:
-                # If both are dictionaries
-                if isinstance(base_layer[key], dict) and isinstance(
-                    new_layer[key], dict
-                ):
-                    # Merge the two nested dictionaries together
-                    self._merge(base_layer[key], new_layer[key], path + [str(key)])
-                # If both are lists
-                elif isinstance(base_layer[key], list) and isinstance(
-                    new_layer[key], list
-                ):
-                    # Extend the list of the base layer by the new layer
-                    base_layer[key].extend(new_layer[key])
+        base_layer : `dict`
+            The base dictionary, which has been updated in-place.
+        """
+        # Layers that only add new keys need no merging at all
+        if base_layer.keys().isdisjoint(new_layer):
+            base_layer.update(new_layer)
+            return base_layer
+
+        stack = [(base_layer, new_layer)]
+        while stack:
+            base, new = stack.pop()
+            for key, new_value in new.items():
+                base_value = base.get(key, _MISSING)
+                # If its not a shared key
+                if base_value is _MISSING:
+                    base[key] = new_value
+                    continue
+                base_type = type(base_value)
+                # If both are dictionaries, merge the two nested dictionaries together
+                if base_type is dict and type(new_value) is dict:
+                    stack.append((base_value, new_value))
+                # If both are lists, extend the list of the base layer by the new layer
+                elif base_type is list and type(new_value) is list:
+                    base_value.extend(new_value)
                 # If they are not lists or dicts (scalars)
-                elif base_layer[key] != new_layer[key]:
-                    # We've reached a conflict, may want to overwrite the base with the new layer.
-                    base_layer[key] = new_layer[key]
-            # If its not a shared key
+                elif base_value != new_value:
+                    # We've reached a conflict, overwrite the base with the new layer.
+                    base[key] = new_value
+        return base_layer
+
+    @staticmethod
+    def _merge_schema_fast(base_layer: dict, new_layer: dict) -> dict:
+        """
+        Merge a schema layer shaped as ``{attr_name: {key: scalar}}`` into a base layer.
+
+        Schema layers describe each attribute with a flat dictionary of scalars, so
+        the entries of shared attributes can be merged with a single `dict.update`.
+        Entries that do not have this shape are merged with `_merge` instead, so
+        the result is the same as merging the whole layer with `_merge`.
+
+        Parameters
+        ----------
+        base_layer : `dict`
+            The base schema to merge into.
+        new_layer : `dict`
+            The new schema layer to merge into the base.
+
+        Returns
+        -------
+        base_layer : `dict`
+            The base schema, which has been updated in-place.
+        """
+        # Layers that only add new attributes need no merging at all
+        if base_layer.keys().isdisjoint(new_layer):
+            base_layer.update(new_layer)
+            return base_layer
+
+        for attr_name, new_schema in new_layer.items():
+            base_schema = base_layer.get(attr_name, _MISSING)
+            if base_schema is _MISSING:
+                base_layer[attr_name] = new_schema
+            elif (
+                type(base_schema) is dict
+                and type(new_schema) is dict
+                and not any(
+                    type(value) is dict or type(value) is list
+                    for value in new_schema.values()
+                )
+            ):
+                base_schema.update(new_schema)
             else:
-                base_layer[key] = new_layer[key]
+                CdfAttributeManager._merge(
+                    base_layer=base_layer, new_layer={attr_name: new_schema}
+                )
         return base_layer
 
     # =========================================================================
@@ -346,21 +711,40 @@ class CdfAttributeManager:
             The global attribute values created from the input global attribute files
             and schemas.
         """
+        global_attributes = self._global_attributes
+        # Instrument specific global attributes, if any were loaded for instrument_id
+        instrument_attributes = (
+            global_attributes.get(instrument_id) if instrument_id is not None else None
+        )
+        if not isinstance(instrument_attributes, dict):
+            instrument_attributes = None
+
+        required_attr_names = self._required_global_attr_names
         output = dict()
-        for attr_name, attr_schema in self.global_attribute_schema.items():
-            if attr_name in self._global_attributes:
-                output[attr_name] = self._global_attributes[attr_name]
+        for attr_name in self._global_attr_schema:
+            if attr_name in global_attributes:
+                output[attr_name] = global_attributes[attr_name]
             # Retrieve instrument specific global attributes from the variable file
             elif (
-                instrument_id is not None
-                and attr_name in self._global_attributes[instrument_id]
+                instrument_attributes is not None and attr_name in instrument_attributes
             ):
-                output[attr_name] = self._global_attributes[instrument_id][attr_name]
-            elif attr_schema["required"] and attr_name not in self._global_attributes:
+                output[attr_name] = instrument_attributes[attr_name]
+            elif attr_name in required_attr_names:
                 # TODO throw an error
                 output[attr_name] = None
         return output
 
+    def required_global_attributes(self) -> frozenset:
+        """
+        Function to get the names of the global attributes required by the schema.
+
+        Returns
+        -------
+        required : `frozenset`
+            The names of the required global attributes.
+        """
+        return self._required_global_attr_names
+
     def global_attribute_template(self) -> dict:
         """
         Function to generate a template of required global attributes
@@ -371,13 +755,16 @@ class CdfAttributeManager:
         template : `dict`
             A template for required global attributes that must be provided.
         """
-        template = {}
-        for attr_name, attr_schema in self.global_attribute_schema.items():
-            if attr_schema["required"] and attr_name not in self._global_attributes:
-                template[attr_name] = None
+        global_attributes = self._global_attributes
+        # Required attributes are kept in schema order, so the template keeps it too
+        template = dict.fromkeys(
+            attr_name
+            for attr_name in self._required_global_attrs
+            if attr_name not in global_attributes
+        )
         return template
 
-    def global_attribute_info(self, attribute_name: Optional[str] = None) -> dict:
+    def global_attribute_info(self, attribute_name: Optional[str] = None) -> Mapping:
         """
         Function to generate a `dict` of information about each global
         metadata attribute. The `dict` contains all information in the
@@ -395,28 +782,29 @@ class CdfAttributeManager:
 
         Returns
         -------
-        info: `dict`
-            information about global metadata
+        info: `Mapping`
+            information about global metadata. Without an ``attribute_name`` this
+            is a read-only view of the information for all attributes, nested
+            entries included, which is shared between calls. For a single
+            attribute it is a new `dict`.
 
         Raises
         ------
         KeyError: If attribute_name is not a recognized global attribute.
         """
-        info = self.global_attribute_schema.copy()
-
-        # Strip the Description of New Lines
-        for attr_name in info.keys():
-            info[attr_name]["description"] = info[attr_name]["description"].strip()
-
-        # Limit the Info to the requested Attribute
-        if attribute_name and attribute_name in info:
-            info = info[attribute_name]
-        elif attribute_name and attribute_name not in info:
-            raise KeyError(
-                f"Cannot find Global Metadata for attribute name: {attribute_name}"
-            )
+        # Limit the Info to the requested Attribute, without building the full table
+        if attribute_name:
+            attr_schema = self._global_attr_schema.get(attribute_name)
+            if attr_schema is None:
+                raise KeyError(
+                    f"Cannot find Global Metadata for attribute name: {attribute_name}"
+                )
+            return dict(attr_schema)
 
-        return info
+        if self._global_attr_info is None:
+            # The attribute schemas are read-only, so the info table can share them
+            self._global_attr_info = MappingProxyType(dict(self._global_attr_schema))
+        return self._global_attr_info
 
     # =========================================================================
     #                       VARIABLE ATTRIBUTE FUNCTIONS
@@ -461,29 +849,66 @@ class CdfAttributeManager:
             Information containing specific variable attributes
             associated with "variable_name".
         """
+        variable_attributes = self._variable_attributes
+
         # Case to handle attributes not in schema
         if check_schema is False:
-            if variable_name in self._variable_attributes:
-                return_dict: dict = self._variable_attributes[variable_name]
+            return_dict: dict = variable_attributes.get(variable_name, _MISSING)
+            if return_dict is not _MISSING:
                 return return_dict
             # TODO: throw an error?
             return {}
 
+        return self._check_variable_attributes(
+            variable_name, variable_attributes[variable_name]
+        )
+
+    def _check_variable_attributes(
+        self, variable_name: str, variable_attrs: dict
+    ) -> dict:
+        """
+        Check the attributes of a variable against the variable schema.
+
+        Parameters
+        ----------
+        variable_name : str
+            The name of the variable, used in warnings.
+        variable_attrs : dict
+            The loaded attributes of the variable.
+
+        Returns
+        -------
+        dict
+            The attributes of the variable that are in the schema, with required
+            attributes that are not present set to "".
+        """
+        if self._variable_attr_schema is None:
+            self._load_variable_attr_schema()
+
+        # Sort the variable's indexed attributes into their DEPEND_i, LABL_PTR_i and
+        # REPRESENTATION_i groups with a single pass over its attribute names
+        variable_depend_attrs = []
+        variable_labl_attrs = []
+        variable_rep_attrs = []
+        for key in variable_attrs:
+            if not key.startswith(_INDEXED_ATTR_PREFIXES):
+                continue
+            if key.startswith("DEPEND_"):
+                variable_depend_attrs.append(key)
+            elif key.startswith("LABL_PTR_"):
+                variable_labl_attrs.append(key)
+            else:
+                variable_rep_attrs.append(key)
+
         output = dict()
-        for attr_name in self.variable_attribute_schema["attribute_key"]:
+        for attr_name in self._variable_attr_names:
             # Standard case
-            if attr_name in self._variable_attributes[variable_name]:
-                output[attr_name] = self._variable_attributes[variable_name][attr_name]
+            if attr_name in variable_attrs:
+                output[attr_name] = variable_attrs[attr_name]
             # Case to handle DEPEND_i schema issues
             elif attr_name == "DEPEND_i":
                 # DEFAULT_0 is not required, UNLESS we are dealing with
                 # variable_name = epoch
-                # Find all the attributes of variable_name that contain "DEPEND"
-                variable_depend_attrs = [
-                    key
-                    for key in self._variable_attributes[variable_name].keys()
-                    if "DEPEND" in key
-                ]
                 # Confirm that each DEPEND_i attribute is unique
                 if len(set(variable_depend_attrs)) != len(variable_depend_attrs):
                     logging.warning(
@@ -491,40 +916,18 @@ class CdfAttributeManager:
                         f"{variable_name}: {variable_depend_attrs}"
                     )
                 for variable_depend_attr in variable_depend_attrs:
-                    output[variable_depend_attr] = self._variable_attributes[
-                        variable_name
-                    ][variable_depend_attr]
+                    output[variable_depend_attr] = variable_attrs[variable_depend_attr]
                 # TODO: Add more DEPEND_0 variable checks!
             # Case to handle LABL_PTR_i schema issues
             elif attr_name == "LABL_PTR_i":
-                # Find all the attributes of variable_name that contain "LABL_PTR"
-                variable_labl_attrs = [
-                    key
-                    for key in self._variable_attributes[variable_name].keys()
-                    if "LABL_PTR" in key
-                ]
                 for variable_labl_attr in variable_labl_attrs:
-                    output[variable_labl_attr] = self._variable_attributes[
-                        variable_name
-                    ][variable_labl_attr]
+                    output[variable_labl_attr] = variable_attrs[variable_labl_attr]
             # Case to handle REPRESENTATION_i schema issues
             elif attr_name == "REPRESENTATION_i":
-                # Find all the attributes of variable_name that contain
-                # "REPRESENTATION_i"
-                variable_rep_attrs = [
-                    key
-                    for key in self._variable_attributes[variable_name].keys()
-                    if "REPRESENTATION" in key
-                ]
                 for variable_rep_attr in variable_rep_attrs:
-                    output[variable_rep_attr] = self._variable_attributes[
-                        variable_name
-                    ][variable_rep_attr]
+                    output[variable_rep_attr] = variable_attrs[variable_rep_attr]
             # Validating required schema
-            elif (
-                self.variable_attribute_schema["attribute_key"][attr_name]["required"]
-                and attr_name not in self._variable_attributes[variable_name]
-            ):
+            elif attr_name in self._required_variable_attr_names:
                 logging.warning(
                     "Required schema '"
                     + attr_name
@@ -535,6 +938,19 @@ class CdfAttributeManager:
 
         return output
 
+    def required_variable_attributes(self) -> frozenset:
+        """
+        Function to get the names of the variable attributes required by the schema.
+
+        Returns
+        -------
+        required : `frozenset`
+            The names of the required variable attributes.
+        """
+        if self._variable_attr_schema is None:
+            self._load_variable_attr_schema()
+        return self._required_variable_attr_names
+
     def variable_attribute_template(self) -> dict:
         """
         Function to generate a template of required variable attributes
@@ -545,15 +961,12 @@ class CdfAttributeManager:
         template: `dict`
             A template for required variable attributes that must be provided.
         """
-        template = {}
-        for attr_name, attr_schema in self.variable_attribute_schema[
-            "attribute_key"
-        ].items():
-            if attr_schema["required"]:
-                template[attr_name] = None
+        if self._variable_attr_schema is None:
+            self._load_variable_attr_schema()
+        template = dict.fromkeys(self._required_variable_attrs)
         return template
 
-    def variable_attribute_info(self, attribute_name: Optional[str] = None) -> dict:
+    def variable_attribute_info(self, attribute_name: Optional[str] = None) -> Mapping:
         """
         Function to generate a `dict` of information about each variable
         metadata attribute. The `dict` contains all information in the SWxSOC
@@ -576,36 +989,58 @@ class CdfAttributeManager:
 
         Returns
         -------
-        info: `dict`
-            information about variable metadata
+        info: `Mapping`
+            information about variable metadata. Without an ``attribute_name`` this
+            is a read-only view of the information for all attributes, nested
+            entries included, which is shared between calls. For a single
+            attribute it is a new `dict`.
 
         Raises
         ------
         KeyError: If attribute_name is not a recognized variable attribute.
         """
-        info = self.variable_attribute_schema["attribute_key"].copy()
-
-        # Strip the Description of New Lines
-        for attr_name in info.keys():
-            info[attr_name]["description"] = info[attr_name]["description"].strip()
-
-        # Create New Column to describe which VAR_TYPE's require the given attribute
-        for attr_name in info.keys():
-            # Create a new list to store the var types
-            info[attr_name]["var_types"] = []
-            for var_type in ["data", "support_data", "metadata"]:
-                # If the attribute is required for the given var type
-                if attr_name in self.variable_attribute_schema[var_type]:
-                    info[attr_name]["var_types"].append(var_type)
-            # Convert the list to a string that can be written to a CSV from the table
-            info[attr_name]["var_types"] = ", ".join(info[attr_name]["var_types"])
-
-        # Limit the Info to the requested Attribute
-        if attribute_name and attribute_name in info:
-            info = info[attribute_name]
-        elif attribute_name and attribute_name not in info:
-            raise KeyError(
-                f"Cannot find Variable Metadata for attribute name: {attribute_name}"
+        if self._variable_attr_schema is None:
+            self._load_variable_attr_schema()
+
+        # Limit the Info to the requested Attribute, without building the full table
+        if attribute_name:
+            attr_schema = self._variable_attr_keys_schema.get(attribute_name)
+            if attr_schema is None:
+                raise KeyError(
+                    f"Cannot find Variable Metadata for attribute name: {attribute_name}"
+                )
+            return self._variable_attr_info_entry(attribute_name, attr_schema)
+
+        if self._variable_attr_info is None:
+            self._variable_attr_info = MappingProxyType(
+                {
+                    attr_name: MappingProxyType(
+                        self._variable_attr_info_entry(attr_name, attr_schema)
+                    )
+                    for attr_name, attr_schema in self._variable_attr_keys_schema.items()
+                }
             )
+        return self._variable_attr_info
+
+    def _variable_attr_info_entry(self, attr_name: str, attr_schema: dict) -> dict:
+        """
+        Build the information about a single variable attribute from its schema.
 
+        Parameters
+        ----------
+        attr_name : `str`
+            The name of the variable attribute.
+        attr_schema : `dict`
+            The schema of the variable attribute.
+
+        Returns
+        -------
+        info: `dict`
+            A copy of the attribute schema, so it does not alias the schema, along
+            with the VAR_TYPE's that require the attribute.
+        """
+        info = dict(attr_schema)
+        # Create New Column to describe which VAR_TYPE's require the given attribute,
+        # as a string that can be written to a CSV from the table
+        info["var_types"] = ", ".join(self._attr_var_types.get(attr_name, ()))
         return info
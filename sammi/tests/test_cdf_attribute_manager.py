@@ -1,46 +1,211 @@
+from collections.abc import Mapping
+import copy
+import io
+import logging
+import os
 from pathlib import Path
-import tempfile
+import sys
 
 import pytest
 import yaml
 
 from sammi.cdf_attribute_manager import CdfAttributeManager
 
-
-@pytest.fixture()
+# Extra Global Layer for Testing Custom Layers
+GLOBAL_LAYER_CONTENT = """
+test_attribute:
+    description: This is a test attribute
+    default: null
+    required: true
+Data_type:
+    required: true   # NOT originally required in Default Schema
+"""
+
+# Extra Variable Layer for Testing Custom Layers
+VARIABLE_LAYER_CONTENT = """
+attribute_key:
+    test_attribute:
+        description: This is a test attribute
+        required: true
+        valid_values: null
+        alternate: null
+    SI_CONVERSION:
+        description: The conversion factor to SI units.
+        required: true  # NOT originally required in Default Schema
+        valid_values: null
+        alternate: null
+data:
+    - test_attribute
+    - SI_CONVERSION
+support_data:
+    - test_attribute
+    - SI_CONVERSION
+metadata:
+    - test_attribute
+"""
+
+
+@pytest.fixture(scope="module")
 def cdf_manager():
-    """Initialize CdfAttributeManager with default properties."""
+    """Initialize CdfAttributeManager with default properties, shared by the module."""
     cdf_manager = CdfAttributeManager(use_defaults=True)
     return cdf_manager
 
 
-def test_load_yaml_data():
+@pytest.fixture(autouse=True)
+def reset_cdf_manager(cdf_manager):
+    """Restore the attributes of the shared CdfAttributeManager after each test."""
+    global_attributes = copy.deepcopy(cdf_manager._global_attributes)
+    variable_attributes = copy.deepcopy(cdf_manager._variable_attributes)
+    yield
+    cdf_manager._global_attributes = global_attributes
+    cdf_manager._variable_attributes = variable_attributes
+
+
+def test_load_yaml_data(tmp_path):
     """Test Loading Yaml Data for Schema Files"""
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        # This function writes invalid YAML content into a file
-        invalid_yaml = """
+    # Load valid YAML content from a stream
+    valid_yaml = io.StringIO("name: John Doe\nage: 30\n")
+    assert CdfAttributeManager._load_yaml_data(valid_yaml) == {
+        "name": "John Doe",
+        "age": 30,
+    }
+
+    # Load invalid YAML content from a stream
+    invalid_yaml = io.StringIO(
+        """
         name: John Doe
         age 30
         """
-
-        with open(tmpdirname + "test.yaml", "w") as file:
-            file.write(invalid_yaml)
-
-        # Load from an non-existant file
-        with pytest.raises(yaml.YAMLError):
-            _ = CdfAttributeManager()._load_yaml_data(tmpdirname + "test.yaml")
+    )
+    with pytest.raises(yaml.YAMLError):
+        _ = CdfAttributeManager()._load_yaml_data(invalid_yaml)
+
+    # Load from a file, with keys sharing the interned string objects
+    yaml_path = tmp_path / "test.yaml"
+    with open(yaml_path, "w") as file:
+        file.write("name: John Doe\n")
+    first = CdfAttributeManager._load_yaml_data(yaml_path)
+    assert first == {"name": "John Doe"}
+    assert next(iter(first)) is sys.intern("name")
+
+    # Changing the file on disk must be picked up
+    with open(yaml_path, "w") as file:
+        file.write("name: John Doe\nage: 30\n")
+    assert CdfAttributeManager._load_yaml_data(yaml_path) == {
+        "name": "John Doe",
+        "age": 30,
+    }
+
+    # Empty files load as None, like yaml.safe_load
+    with open(yaml_path, "w") as file:
+        pass
+    assert CdfAttributeManager._load_yaml_data(yaml_path) is None
+
+    # Load from a file that does not exist
+    with pytest.raises(FileNotFoundError, match="missing.yaml"):
+        _ = CdfAttributeManager._load_yaml_data(tmp_path / "missing.yaml")
+
+
+def test_load_schema_data_cache(monkeypatch, tmp_path):
+    """Test Loading Schema Files through the Pickle Cache"""
+    schema_path = tmp_path / "schema.yaml"
+    with open(schema_path, "w") as file:
+        file.write("test_attribute:\n  required: true\n")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+
+    # The cache is not used unless it is enabled
+    monkeypatch.delenv("SAMMI_SCHEMA_CACHE", raising=False)
+    schema = CdfAttributeManager._load_schema_data(schema_path)
+    assert schema == {"test_attribute": {"required": True}}
+    assert not cache_dir.exists()
+
+    # Enabled, the first load writes the cache and later loads reuse it
+    monkeypatch.setenv("SAMMI_SCHEMA_CACHE", "1")
+    assert CdfAttributeManager._load_schema_data(schema_path) == schema
+    cache_files = list((cache_dir / "sammi" / "schemas").iterdir())
+    assert [cache_file.suffix for cache_file in cache_files] == [".pkl"]
+    assert CdfAttributeManager._load_schema_data(schema_path) == schema
+
+    # A changed file is parsed again, even if its timestamp is older than the cache
+    old_mtime_ns = os.stat(schema_path).st_mtime_ns - 10**10
+    with open(schema_path, "w") as file:
+        file.write("test_attribute:\n  required: false\n")
+    os.utime(schema_path, ns=(old_mtime_ns, old_mtime_ns))
+    assert CdfAttributeManager._load_schema_data(schema_path) == {
+        "test_attribute": {"required": False}
+    }
+    # Nothing is written next to the schema file
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cache", "schema.yaml"]
+
+
+def test_merge(cdf_manager):
+    """Test Merging Nested Layers of Dicts, Lists and Scalars"""
+    base_layer = {
+        "a": {"b": {"c": 1, "d": 2}, "e": [1, 2]},
+        "f": "base",
+        "g": None,
+    }
+    new_layer = {
+        "a": {"b": {"c": 10}, "e": [3]},
+        "f": "new",
+        "h": {"i": True},
+    }
+
+    merged = cdf_manager._merge(base_layer, new_layer)
+
+    # Merging is done in-place
+    assert merged is base_layer
+    assert merged == {
+        "a": {"b": {"c": 10, "d": 2}, "e": [1, 2, 3]},
+        "f": "new",
+        "g": None,
+        "h": {"i": True},
+    }
+
+    # Layers without shared keys are added as they are
+    nested = {"k": [1]}
+    merged = cdf_manager._merge({"j": 1}, nested)
+    assert merged == {"j": 1, "k": [1]}
+    assert merged["k"] is nested["k"]
+
+
+def test_merge_schema_fast(cdf_manager):
+    """Test the Schema Merge Matches the General Merge"""
+
+    def layers():
+        base_layer = {
+            "a": {"required": False, "default": None},
+            "b": {"required": True, "default": ["x"]},
+        }
+        new_layer = {
+            "a": {"required": True},
+            "b": {"default": ["y"]},
+            "c": {"required": False},
+        }
+        return base_layer, new_layer
+
+    merged = cdf_manager._merge_schema_fast(*layers())
+    assert merged == cdf_manager._merge(*layers())
+    assert merged == {
+        "a": {"required": True, "default": None},
+        "b": {"required": True, "default": ["x", "y"]},
+        "c": {"required": False},
+    }
 
 
 def test_default_attr_schema(cdf_manager):
     """
     Test function that covers:
-        _load_default_global_attr_schema
-        _load_default_variable_attr_schema
+        _get_built_schema
     """
 
     # Default global tests
     assert cdf_manager.global_attribute_schema["DOI"]["required"] is False
     assert cdf_manager.global_attribute_schema["Data_type"]["required"] is True
+    assert "Data_type" in cdf_manager.required_global_attributes()
+    assert "DOI" not in cdf_manager.required_global_attributes()
 
     # Default variable tests
     assert (
@@ -53,6 +218,86 @@ def test_default_attr_schema(cdf_manager):
         cdf_manager.variable_attribute_schema["attribute_key"]["CATDESC"]["required"]
         is True
     )
+    assert "CATDESC" in cdf_manager.required_variable_attributes()
+
+    # The schemas are read-only views, nested entries included
+    with pytest.raises(TypeError):
+        cdf_manager.global_attribute_schema["DOI"] = {}
+    with pytest.raises(TypeError):
+        cdf_manager.global_attribute_schema["DOI"]["required"] = True
+    with pytest.raises(TypeError):
+        cdf_manager.variable_attribute_schema["attribute_key"] = {}
+    with pytest.raises(TypeError):
+        cdf_manager.variable_attribute_schema["attribute_key"]["CATDESC"][
+            "required"
+        ] = False
+    with pytest.raises(AttributeError):
+        cdf_manager.variable_attribute_schema["data"].append("DOI")
+    with pytest.raises(TypeError):
+        cdf_manager.global_attribute_info()["DOI"]["required"] = True
+    with pytest.raises(TypeError):
+        cdf_manager.variable_attribute_info()["CATDESC"]["required"] = False
+    assert "DOI" not in cdf_manager.required_global_attributes()
+    assert "CATDESC" in cdf_manager.required_variable_attributes()
+
+    # Instances built from the same layers share the read-only schema
+    first_manager = CdfAttributeManager(use_defaults=True)
+    assert first_manager.global_attribute_schema == cdf_manager.global_attribute_schema
+
+
+def test_variable_attr_schema_lazy():
+    """Test the Variable Schema is only Built when Needed"""
+    cdf_manager = CdfAttributeManager(use_defaults=True)
+    assert cdf_manager._variable_attr_schema is None
+
+    # Global attributes do not need the variable schema
+    cdf_manager.get_global_attributes()
+    assert cdf_manager._variable_attr_schema is None
+
+    assert "CATDESC" in cdf_manager.variable_attribute_template()
+    assert cdf_manager._variable_attr_schema is not None
+
+    # Missing layer files are still reported when the manager is created
+    with pytest.raises(FileNotFoundError):
+        CdfAttributeManager(variable_schema_layers=[Path("/nonexistent/var.yaml")])
+
+
+def test_built_schema_cache(tmp_path):
+    """Test Schemas Built from the Same Layers are Reused"""
+    global_test_path = tmp_path / "global_test.yaml"
+    with open(global_test_path, "w") as file:
+        file.write("test_attribute:\n  required: false\n")
+
+    first = CdfAttributeManager(global_schema_layers=[global_test_path])
+    second = CdfAttributeManager(global_schema_layers=[global_test_path])
+    assert first.global_attribute_schema is second.global_attribute_schema
+
+    # Changing a layer on disk builds the schema again
+    with open(global_test_path, "w") as file:
+        file.write("test_attribute:\n  required: true\n  default: Test\n")
+    third = CdfAttributeManager(global_schema_layers=[global_test_path])
+    assert third.global_attribute_schema["test_attribute"]["required"] is True
+    assert third.get_global_attributes()["test_attribute"] == "Test"
+
+
+def test_multiple_schema_layers(tmp_path):
+    """Test Later Schema Layers Override Earlier Ones"""
+    # Start without any built schemas, so the defaults are read alongside the layers
+    CdfAttributeManager._build_schema.cache_clear()
+    layer_paths = []
+    for i in range(3):
+        layer_path = tmp_path / f"global_layer_{i}.yaml"
+        with open(layer_path, "w") as file:
+            file.write(f"test_attribute:\n  default: layer_{i}\n")
+            file.write(f"layer_{i}_attribute:\n  required: false\n")
+        layer_paths.append(layer_path)
+
+    cdf_manager = CdfAttributeManager(global_schema_layers=layer_paths)
+    schema = cdf_manager.global_attribute_schema
+    assert schema["test_attribute"]["default"] == "layer_2"
+    assert all(f"layer_{i}_attribute" in schema for i in range(3))
+    # The default schema is still the first layer
+    assert schema["Data_type"]["required"] is True
 
 
 def test_cdf_manager_invalid_params():
@@ -63,95 +308,61 @@ def test_cdf_manager_invalid_params():
         )
 
 
-def test_cdf_manager_custom_layers():
+def test_cdf_manager_custom_layers(tmp_path):
     """Test Creating a Schema with Custom Layers"""
-    with tempfile.TemporaryDirectory() as tmpdirname:
-
-        # Create Extra Global Layer for Testing
-        global_layer_content = """
-        test_attribute:
-            description: This is a test attribute
-            default: null
-            required: true
-        Data_type:
-            required: true   # NOT originally required in Default Schema
-        """
 
-        global_test_path = Path(tmpdirname) / "global_test.yaml"
-        with open(global_test_path, "w") as file:
-            file.write(global_layer_content)
-        assert global_test_path.is_file()
-
-        # Create Extra Variable Layer for Testing
-        variable_layer_content = """
-        attribute_key:
-            test_attribute:
-                description: This is a test attribute
-                required: true
-                valid_values: null
-                alternate: null
-            SI_CONVERSION:
-                description: The conversion factor to SI units.
-                required: true  # NOT originally required in Default Schema
-                valid_values: null
-                alternate: null
-        data:
-            - test_attribute
-            - SI_CONVERSION
-        support_data:
-            - test_attribute
-            - SI_CONVERSION
-        metadata:
-            - test_attribute
-        """
+    global_test_path = tmp_path / "global_test.yaml"
+    with open(global_test_path, "w") as file:
+        file.write(GLOBAL_LAYER_CONTENT)
+    assert global_test_path.is_file()
 
-        variable_test_path = Path(tmpdirname) / "variable_test.yaml"
-        with open(variable_test_path, "w") as file:
-            file.write(variable_layer_content)
-        assert variable_test_path.is_file()
+    variable_test_path = tmp_path / "variable_test.yaml"
+    with open(variable_test_path, "w") as file:
+        file.write(VARIABLE_LAYER_CONTENT)
+    assert variable_test_path.is_file()
 
-        cdf_manager = CdfAttributeManager(
-            global_schema_layers=[global_test_path],
-            variable_schema_layers=[variable_test_path],
-            use_defaults=True,
-        )
-
-        assert cdf_manager.global_attribute_schema is not None
-        # Assert Test Attribute is Added to the Global Schema
-        assert "test_attribute" in cdf_manager.global_attribute_schema
-        assert cdf_manager.global_attribute_schema["test_attribute"]["required"]
-        # Assert Data_type is Overwritten in Global Schema
-        assert "Data_type" in cdf_manager.global_attribute_schema
-        assert cdf_manager.global_attribute_schema["Data_type"]["required"]
-        # Assert other Data_type attributes are not overwritten
-        assert (
-            cdf_manager.global_attribute_schema["Data_type"]["description"] is not None
-        )
+    cdf_manager = CdfAttributeManager(
+        global_schema_layers=[global_test_path],
+        variable_schema_layers=[variable_test_path],
+        use_defaults=True,
+    )
 
-        assert cdf_manager.variable_attribute_schema is not None
-        # Assert Test Attribute is Added to the Variable Schema
-        assert (
-            "test_attribute" in cdf_manager.variable_attribute_schema["attribute_key"]
-        )
-        assert cdf_manager.variable_attribute_schema["attribute_key"]["test_attribute"][
-            "required"
-        ]
-        # Assert SI_CONVERSION is Overwritten in Variable Schema
-        assert "SI_CONVERSION" in cdf_manager.variable_attribute_schema["attribute_key"]
-        assert cdf_manager.variable_attribute_schema["attribute_key"]["SI_CONVERSION"][
-            "required"
-        ]
+    assert cdf_manager.global_attribute_schema is not None
+    # Assert Test Attribute is Added to the Global Schema
+    assert "test_attribute" in cdf_manager.global_attribute_schema
+    assert cdf_manager.global_attribute_schema["test_attribute"]["required"]
+    # Assert Data_type is Overwritten in Global Schema
+    assert "Data_type" in cdf_manager.global_attribute_schema
+    assert cdf_manager.global_attribute_schema["Data_type"]["required"]
+    # Assert other Data_type attributes are not overwritten
+    assert cdf_manager.global_attribute_schema["Data_type"]["description"] is not None
+
+    assert cdf_manager.variable_attribute_schema is not None
+    # Assert Test Attribute is Added to the Variable Schema
+    assert "test_attribute" in cdf_manager.variable_attribute_schema["attribute_key"]
+    assert cdf_manager.variable_attribute_schema["attribute_key"]["test_attribute"][
+        "required"
+    ]
+    # Assert SI_CONVERSION is Overwritten in Variable Schema
+    assert "SI_CONVERSION" in cdf_manager.variable_attribute_schema["attribute_key"]
+    assert cdf_manager.variable_attribute_schema["attribute_key"]["SI_CONVERSION"][
+        "required"
+    ]
 
-        # Assert Var Type Lists are Updated
-        assert len(cdf_manager.variable_attribute_schema["data"]) > 2
-        assert len(cdf_manager.variable_attribute_schema["support_data"]) > 2
-        assert len(cdf_manager.variable_attribute_schema["metadata"]) > 1
-        assert "test_attribute" in cdf_manager.variable_attribute_schema["data"]
-        assert "test_attribute" in cdf_manager.variable_attribute_schema["support_data"]
-        assert "test_attribute" in cdf_manager.variable_attribute_schema["metadata"]
-        assert "SI_CONVERSION" in cdf_manager.variable_attribute_schema["data"]
-        assert "SI_CONVERSION" in cdf_manager.variable_attribute_schema["support_data"]
-        assert "SI_CONVERSION" not in cdf_manager.variable_attribute_schema["metadata"]
+    # Assert Var Type Lists are Updated
+    assert len(cdf_manager.variable_attribute_schema["data"]) > 2
+    assert len(cdf_manager.variable_attribute_schema["support_data"]) > 2
+    assert len(cdf_manager.variable_attribute_schema["metadata"]) > 1
+    assert "test_attribute" in cdf_manager.variable_attribute_schema["data"]
+    assert "test_attribute" in cdf_manager.variable_attribute_schema["support_data"]
+    assert "test_attribute" in cdf_manager.variable_attribute_schema["metadata"]
+    assert "SI_CONVERSION" in cdf_manager.variable_attribute_schema["data"]
+    assert "SI_CONVERSION" in cdf_manager.variable_attribute_schema["support_data"]
+    assert "SI_CONVERSION" not in cdf_manager.variable_attribute_schema["metadata"]
+    # Attributes listed by several layers are only listed once
+    for var_type in ["data", "support_data", "metadata"]:
+        var_type_attrs = cdf_manager.variable_attribute_schema[var_type]
+        assert len(set(var_type_attrs)) == len(var_type_attrs)
 
 
 def test_load_global_attribute(cdf_manager):
@@ -190,10 +401,9 @@ def test_load_global_attribute(cdf_manager):
         cdf_manager._global_attributes["File_naming_convention"]
         == "source_descriptor_datatype_yyyyMMdd_vNNN"
     )
-    # The following test should fail because "DOI" is not an attribute in
+    # "DOI" is not loaded because it is not an attribute in
     #   imap_default_global_cdf_attrs.yaml
-    with pytest.raises(KeyError):
-        assert cdf_manager._global_attributes["DOI"] == "test"
+    assert "DOI" not in cdf_manager._global_attributes
 
     # Load in different data
     cdf_manager.load_global_attributes(
@@ -224,8 +434,11 @@ def test_load_global_attribute(cdf_manager):
 
     # Testing that everything loaded into the global attrs is present in
     #   the global attrs schema
-    for attr in cdf_manager._global_attributes.keys():
-        assert attr in cdf_manager.global_attribute_schema.keys()
+    unknown = (
+        cdf_manager._global_attributes.keys()
+        - cdf_manager.global_attribute_schema.keys()
+    )
+    assert not unknown, f"Not in schema: {unknown}"
 
 
 def test_get_global_attributes(cdf_manager):
@@ -259,13 +472,11 @@ def test_get_global_attributes(cdf_manager):
         == "IMAP Mission TEST one document Level-T1."
     )
     # Not given, and not required information
-    with pytest.raises(KeyError):
-        assert test_get_global_attrs["bad_name"] == "false info"
+    assert "bad_name" not in test_get_global_attrs
 
     # Testing second elif statement
     test_error_elif = cdf_manager.get_global_attributes("imap_test_T3_test")
-    with pytest.raises(KeyError):
-        assert test_error_elif["Generation_date"] == "Does Not Exist"
+    assert "Generation_date" not in test_error_elif
 
     # Load in more data using get_global_attributes
     test_get_global_attrs_2 = cdf_manager.get_global_attributes("imap_test_T2_test")
@@ -276,11 +487,14 @@ def test_get_global_attributes(cdf_manager):
     # "Data_type" not required according to default schema
     assert test_get_global_attrs_2["Data_type"] == "T2_test-two>Test-2 test two"
 
+    # Unknown instrument_id falls back to the top level attributes only
+    test_unknown_id = cdf_manager.get_global_attributes("imap_test_unknown")
+    assert test_unknown_id["Project"] == "STP>Solar-Terrestrial Physics"
+    assert test_unknown_id["Logical_source"] is None
+
     # Testing that required schema keys are in get_global_attributes
-    for attr_name in cdf_manager.global_attribute_schema.keys():
-        required_schema = cdf_manager.global_attribute_schema[attr_name]["required"]
-        if required_schema is True:
-            assert attr_name in test_get_global_attrs.keys()
+    missing = cdf_manager.required_global_attributes() - test_get_global_attrs.keys()
+    assert not missing, f"Missing: {missing}"
 
 
 def test_instrument_id_format(cdf_manager):
@@ -312,8 +526,7 @@ def test_instrument_id_format(cdf_manager):
         cdf_manager._global_attributes["imap_test_T1_test"]["Logical_source"]
         == "imap_test_T1_test"
     )
-    with pytest.raises(KeyError):
-        assert cdf_manager._global_attributes["imap_test_T1_test"]["Project"]
+    assert "Project" not in cdf_manager._global_attributes["imap_test_T1_test"]
 
 
 def test_add_global_attribute(cdf_manager):
@@ -335,11 +548,10 @@ def test_add_global_attribute(cdf_manager):
     assert test_get_global_attrs["Project"] == "Test Project"
 
     # Testing adding required global attribute
-    cdf_manager._global_attributes.__delitem__("Source_name")
+    del cdf_manager._global_attributes["Source_name"]
     # Reloading get_global_attributes to pick up deleted Source_name
     test_get_global_attrs = cdf_manager.get_global_attributes("imap_test_T1_test")
-    with pytest.raises(KeyError):
-        assert cdf_manager._global_attributes["Source_name"]
+    assert "Source_name" not in cdf_manager._global_attributes
     assert test_get_global_attrs["Source_name"] is None
 
     # Adding deleted global attribute
@@ -350,11 +562,10 @@ def test_add_global_attribute(cdf_manager):
     assert test_get_global_attrs["Source_name"] == "anas_source"
 
     # Testing instrument specific attribute
-    cdf_manager._global_attributes["imap_test_T1_test"].__delitem__("Logical_source")
+    del cdf_manager._global_attributes["imap_test_T1_test"]["Logical_source"]
     # Reloading get_global_attributes to pick up deleted Source_name
     test_get_global_attrs = cdf_manager.get_global_attributes("imap_test_T1_test")
-    with pytest.raises(KeyError):
-        assert cdf_manager._global_attributes["imap_test_T1_test"]["Logical_source"]
+    assert "Logical_source" not in cdf_manager._global_attributes["imap_test_T1_test"]
     assert test_get_global_attrs["Logical_source"] is None
 
 
@@ -388,13 +599,10 @@ def test_variable_attribute(cdf_manager):
     ]
 
     # Assuring all required attributes are loaded in
-    for attr_name in cdf_manager.variable_attribute_schema["attribute_key"]:
-        attribute = cdf_manager.variable_attribute_schema["attribute_key"][attr_name]
-        if attribute["required"] is True:
-            for exp_attr in expected_attributes:
-                assert (
-                    exp_attr in cdf_manager.variable_attribute_schema["attribute_key"]
-                )
+    missing = set(expected_attributes) - (
+        cdf_manager.variable_attribute_schema["attribute_key"].keys()
+    )
+    assert not missing, f"Missing: {missing}"
 
     # Testing specific attributes
     assert (
@@ -406,11 +614,10 @@ def test_variable_attribute(cdf_manager):
     assert (
         cdf_manager._variable_attributes["default_attrs"]["VAR_TYPE"] == "test_var_type"
     )
-    with pytest.raises(KeyError):
-        assert cdf_manager._variable_attributes["default_attrs"]["CATDESC"] == "test"
+    assert "CATDESC" not in cdf_manager._variable_attributes["default_attrs"]
 
 
-def test_get_variable_attributes(cdf_manager):
+def test_get_variable_attributes(cdf_manager, tmp_path, caplog):
     """
     Test function that covers:
         load_variable_attributes
@@ -428,12 +635,8 @@ def test_get_variable_attributes(cdf_manager):
     imap_test_variable = cdf_manager.get_variable_attributes("test_field_1")
 
     # Make sure all expected attributes are present
-    for variable_attrs in cdf_manager.variable_attribute_schema["attribute_key"]:
-        required_var_attributes = cdf_manager.variable_attribute_schema[
-            "attribute_key"
-        ][variable_attrs]["required"]
-        if required_var_attributes is True:
-            assert variable_attrs in imap_test_variable.keys()
+    missing = cdf_manager.required_variable_attributes() - imap_test_variable.keys()
+    assert not missing, f"Missing: {missing}"
 
     # Calling default attributes
     assert imap_test_variable["DEPEND_0"] == "test_depend"
@@ -450,12 +653,10 @@ def test_get_variable_attributes(cdf_manager):
     assert imap_test_variable["LEAP_SECONDS_INCLUDED"] == "test_not_required"
 
     # Calling attribute name that does not exist
-    with pytest.raises(KeyError):
-        assert imap_test_variable["DOES_NOT_EXIST"]
+    assert "DOES_NOT_EXIST" not in imap_test_variable
 
     # Testing for attribute not in schema
-    with pytest.raises(KeyError):
-        assert imap_test_variable["NOT_IN_SCHEMA"]
+    assert "NOT_IN_SCHEMA" not in imap_test_variable
 
     # Load in different data, test again
     imap_test_variable_2 = cdf_manager.get_variable_attributes("test_field_2")
@@ -485,6 +686,36 @@ def test_get_variable_attributes(cdf_manager):
     assert imap_test_variable_1_false["NOT_IN_SCHEMA"] == "not_in_schema"
     assert imap_test_variable_1_false["VALIDMIN"] == 0
 
+    # Modifying a checked result does not change the loaded attributes
+    imap_test_variable["CATDESC"] = "modified"
+    assert cdf_manager.get_variable_attributes("test_field_1")["CATDESC"] == "test time"
+
+    # Changes to the loaded attributes are seen by later lookups
+    imap_test_variable_1_false["CATDESC"] = "changed"
+    assert cdf_manager.get_variable_attributes("test_field_1")["CATDESC"] == "changed"
+    cdf_manager._variable_attributes["test_field_1"]["CATDESC"] = "changed again"
+    assert (
+        cdf_manager.get_variable_attributes("test_field_1")["CATDESC"]
+        == "changed again"
+    )
+
+    # Loading more variable attributes is seen by later lookups
+    variable_path = tmp_path / "variable.yaml"
+    with open(variable_path, "w") as file:
+        file.write("test_field_1:\n  CATDESC: reloaded\n")
+    cdf_manager.load_variable_attributes(variable_path)
+    assert cdf_manager.get_variable_attributes("test_field_1")["CATDESC"] == "reloaded"
+
+    # Missing required attributes are reported on every lookup
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        cdf_manager.get_variable_attributes("test_field_3")
+        cdf_manager.get_variable_attributes("test_field_3")
+    catdesc_warnings = [
+        record for record in caplog.records if "'CATDESC'" in record.getMessage()
+    ]
+    assert len(catdesc_warnings) == 2
+
 
 def test_sw_templates(cdf_manager):
     """Test Global and Variable Attribute Templates"""
@@ -493,9 +724,18 @@ def test_sw_templates(cdf_manager):
     assert cdf_manager.global_attribute_template() is not None
     assert isinstance(cdf_manager.global_attribute_template(), dict)
 
+    # Required Global Attributes without a value are in the Template
+    global_template = cdf_manager.global_attribute_template()
+    assert "Data_type" in global_template
+    assert "DOI" not in global_template  # Not Required
+    cdf_manager.add_global_attribute("Data_type", "test_data_type")
+    assert "Data_type" not in cdf_manager.global_attribute_template()
+
     # Variable Attribute Template
     assert cdf_manager.variable_attribute_template() is not None
     assert isinstance(cdf_manager.variable_attribute_template(), dict)
+    assert "CATDESC" in cdf_manager.variable_attribute_template()
+    assert "ABSOLUTE_ERROR" not in cdf_manager.variable_attribute_template()
 
 
 def test_sw_info(cdf_manager):
@@ -503,7 +743,9 @@ def test_sw_info(cdf_manager):
 
     # Global Attribute Info
     assert cdf_manager.global_attribute_info() is not None
-    assert isinstance(cdf_manager.global_attribute_info(), dict)
+    assert isinstance(cdf_manager.global_attribute_info(), Mapping)
+    with pytest.raises(TypeError):
+        cdf_manager.global_attribute_info()["Descriptor"] = {}
     assert isinstance(
         cdf_manager.global_attribute_info(attribute_name="Descriptor"), dict
     )
@@ -512,9 +754,29 @@ def test_sw_info(cdf_manager):
 
     # Variable Attribute Info
     assert cdf_manager.variable_attribute_info() is not None
-    assert isinstance(cdf_manager.variable_attribute_info(), dict)
+    assert isinstance(cdf_manager.variable_attribute_info(), Mapping)
+    with pytest.raises(TypeError):
+        cdf_manager.variable_attribute_info()["CATDESC"] = {}
     assert isinstance(
         cdf_manager.variable_attribute_info(attribute_name="CATDESC"), dict
     )
     with pytest.raises(KeyError):
         _ = cdf_manager.variable_attribute_info(attribute_name="NotAnAttribute")
+
+    # Info Functions do not modify the Schemas
+    assert (
+        "var_types"
+        not in cdf_manager.variable_attribute_schema["attribute_key"]["CATDESC"]
+    )
+    assert cdf_manager.global_attribute_schema["Descriptor"]["description"] == (
+        cdf_manager.global_attribute_info(attribute_name="Descriptor")["description"]
+    )
+
+    # Single Attributes match the full tables, without needing to build them
+    other_manager = CdfAttributeManager(use_defaults=True)
+    variable_info = other_manager.variable_attribute_info(attribute_name="CATDESC")
+    assert other_manager._variable_attr_info is None
+    assert variable_info == cdf_manager.variable_attribute_info()["CATDESC"]
+    global_info = other_manager.global_attribute_info(attribute_name="Descriptor")
+    assert other_manager._global_attr_info is None
+    assert global_info == cdf_manager.global_attribute_info()["Descriptor"]
@@ -1,19 +1,31 @@
 from pathlib import Path
+import re
 import tempfile
 import requests
 import requests_mock
+from urllib3.util.retry import Retry
 
 import pytest
 import yaml
 
-from sammi.validation import CDFValidator
+import sammi.validation
+from sammi.validation import CDFValidator, ValidationIssue
+
+
+API_URL = "https://skteditor.heliophysics.net/cgi-bin/checkcdf.cgi"
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Retry failed requests without waiting, so tests without network access are quick."""
+    monkeypatch.setattr(Retry, "get_backoff_time", lambda self: 0)
 
 
 @pytest.fixture()
 def validator():
     """Initialize CDFValidator with default properties."""
-    validator = CDFValidator()
-    return validator
+    with CDFValidator() as validator:
+        yield validator
 
 
 def test_validate_raw_valid_cdf(validator: CDFValidator):
@@ -94,3 +106,262 @@ def test_validate_server_error(validator: CDFValidator):
         assert isinstance(result, list)
         assert len(result) == 1
         assert "API request failed" in result[0]
+
+
+def test_validate_many(validator: CDFValidator):
+    """Test validation of several CDF files at once."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    cdf_paths = [test_data_dir / "test_valid.cdf", test_data_dir / "test_invalid.cdf"]
+
+    with requests_mock.Mocker() as m:
+        m.post(validator.api_url, status_code=500, text="Internal Server Error")
+        result = validator.validate_many(cdf_paths)
+        assert isinstance(result, list)
+        assert len(result) == len(cdf_paths)
+        for errors in result:
+            assert len(errors) == 1
+            assert "API request failed" in errors[0]
+        assert m.call_count == len(cdf_paths)
+
+
+def test_validate_raw_read_timeout(validator: CDFValidator):
+    """Test that an upload is not sent again after a read timeout."""
+    test_data_dir = Path(__file__).parent / "test_data"
+
+    with requests_mock.Mocker() as m:
+        m.post(validator.api_url, exc=requests.exceptions.ReadTimeout)
+        result = validator.validate_raw(test_data_dir / "test_valid.cdf")
+        assert "API request failed" in result
+        assert m.call_count == 1
+
+    # Read errors are never retried, while gateway errors still are
+    retries = validator._session.get_adapter(validator.api_url).max_retries
+    assert retries.total == 3
+    assert retries.read == 0
+    assert retries.is_retry("POST", 503)
+    assert not retries.is_retry("POST", 500)
+
+
+def test_validate_many_cache_eviction(monkeypatch, tmp_path):
+    """Test concurrent validation of more files than the response cache holds."""
+    monkeypatch.setattr(sammi.validation, "_RESPONSE_CACHE_SIZE", 4)
+    cdf_paths = []
+    for i in range(64):
+        cdf_path = tmp_path / f"test_{i}.cdf"
+        cdf_path.write_bytes(f"content-{i}-end".encode())
+        cdf_paths.append(cdf_path)
+
+    def respond(request, context):
+        # Answer with the number of the uploaded file
+        file_number = re.search(rb"content-(\d+)-end", request.body).group(1)
+        return f"Variable test_{file_number.decode()}:\n  error\n"
+
+    with CDFValidator(
+        cache_dir=tmp_path / "cache", max_workers=8, use_cache=True
+    ) as validator:
+        with requests_mock.Mocker() as m:
+            m.post(validator.api_url, text=respond)
+            result = validator.validate_many(cdf_paths)
+        assert result == [[f"Variable test_{i}:: error"] for i in range(64)]
+        assert len(validator._response_cache) == 4
+
+
+def test_validator_max_workers():
+    """Test that the connection pool is sized for the concurrent requests."""
+    with CDFValidator(max_workers=16) as validator:
+        assert validator.max_workers == 16
+        adapter = validator._session.get_adapter(validator.api_url)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+
+
+def test_validator_context_manager(monkeypatch):
+    """Test that the HTTP session is closed when leaving the context."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+    with CDFValidator() as validator:
+        with requests_mock.Mocker() as m:
+            m.post(validator.api_url, text="")
+            assert validator.validate(test_data_dir / "test_valid.cdf") == []
+            assert validator.validate(test_data_dir / "test_invalid.cdf") == []
+            assert m.call_count == 2
+    assert closed == [validator._session]
+
+
+def test_parse_errors(validator: CDFValidator):
+    """Test parsing of a raw validation response."""
+    raw_response = (
+        "Global attribute issues:\n"
+        "  Missing required attribute Descriptor\n"
+        "  Warning: attribute Acknowledgement is empty\n"
+        "\n"
+        "FAILED variable checks. Errors:\n"
+        "Variable Epoch:\n"
+        "  FILLVAL has the wrong type\n"
+        "\n"
+        "Variable Empty:\n"
+        "\n"
+        "Trailing text outside of any section\n"
+    )
+    result = validator._parse_errors(raw_response)
+    assert result == [
+        "Global attribute issues: Missing required attribute Descriptor",
+        "Variable Epoch:: FILLVAL has the wrong type",
+    ]
+
+
+def test_validate_structured(validator: CDFValidator):
+    """Test validation returning the section of each error."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    raw_response = "Variable Epoch:\n  FILLVAL has the wrong type\n"
+
+    with requests_mock.Mocker() as m:
+        m.post(validator.api_url, text=raw_response)
+        result = validator.validate_structured(test_data_dir / "test_valid.cdf")
+        assert result == [
+            ValidationIssue("Variable Epoch", "FILLVAL has the wrong type")
+        ]
+        assert str(result[0]) == "Variable Epoch: FILLVAL has the wrong type"
+        # validate keeps the messages in their original format
+        assert validator.validate(test_data_dir / "test_valid.cdf") == [
+            "Variable Epoch:: FILLVAL has the wrong type"
+        ]
+
+
+@pytest.mark.parametrize("line_break", ["\n", "\r\n", "\r", "\x0c", "\x85", "\u2028"])
+def test_parse_errors_line_breaks(validator: CDFValidator, line_break: str):
+    """Test parsing of responses using any kind of line break."""
+    raw_response = line_break.join(
+        [
+            "Global attribute issues:",
+            "  Missing required attribute Descriptor",
+            "",
+            "Trailing text outside of any section",
+        ]
+    )
+    assert validator._parse_errors(raw_response) == [
+        "Global attribute issues: Missing required attribute Descriptor"
+    ]
+
+
+def test_parse_errors_api_failure(validator: CDFValidator):
+    """Test parsing of a failed API request."""
+    raw_response = "API request failed: Internal Server Error"
+    assert validator._parse_errors(raw_response) == [raw_response]
+
+
+def test_validate_raw_cached(tmp_path):
+    """Test that repeated validation of the same file reuses the response."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    raw_response = "Global attribute issues:\n  Missing Descriptor\n"
+
+    # Responses are not cached unless it is enabled
+    with CDFValidator(cache_dir=tmp_path) as validator:
+        with requests_mock.Mocker() as m:
+            m.post(validator.api_url, text=raw_response)
+            validator.validate_raw(test_data_dir / "test_valid.cdf")
+            validator.validate_raw(test_data_dir / "test_valid.cdf")
+            assert m.call_count == 2
+
+    with CDFValidator(cache_dir=tmp_path, use_cache=True) as validator:
+        with requests_mock.Mocker() as m:
+            m.post(validator.api_url, status_code=500, text="Internal Server Error")
+            validator.validate_raw(test_data_dir / "test_valid.cdf")
+            m.post(validator.api_url, text=raw_response)
+            first = validator.validate_raw(test_data_dir / "test_valid.cdf")
+            second = validator.validate_raw(test_data_dir / "test_valid.cdf")
+            assert first == second == raw_response
+            # Failed requests are not cached
+            assert m.call_count == 2
+
+
+def test_validate_raw_cache_file_name(tmp_path):
+    """Test that files with the same content but different names are cached apart."""
+    first_path = tmp_path / "first.cdf"
+    second_path = tmp_path / "second.cdf"
+    first_path.write_bytes(b"content")
+    second_path.write_bytes(b"content")
+
+    def respond(request, context):
+        # Answer with the name of the uploaded file
+        return re.search(rb'filename="([^"]+)"', request.body).group(1).decode()
+
+    with CDFValidator(cache_dir=tmp_path / "cache", use_cache=True) as validator:
+        with requests_mock.Mocker() as m:
+            m.post(validator.api_url, text=respond)
+            assert validator.validate_raw(first_path) == "first.cdf"
+            assert validator.validate_raw(second_path) == "second.cdf"
+            assert validator.validate_raw(first_path) == "first.cdf"
+            assert m.call_count == 2
+
+
+def test_validator_timeout():
+    """Test that requests to the API are sent with the configured timeout."""
+    test_data_dir = Path(__file__).parent / "test_data"
+
+    with CDFValidator(timeout=(1, 2)) as validator:
+        with requests_mock.Mocker() as m:
+            m.post(validator.api_url, text="")
+            validator.validate_raw(test_data_dir / "test_valid.cdf")
+            assert m.last_request.timeout == (1, 2)
+
+
+def test_validate_raw_disk_cache(tmp_path):
+    """Test that responses are reused across validators through the disk cache."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    raw_response = "Global attribute issues:\n  Missing Descriptor\n"
+
+    with requests_mock.Mocker() as m:
+        m.post(API_URL, text=raw_response)
+
+        # The disk cache is not used unless it is enabled
+        with CDFValidator(cache_dir=tmp_path) as validator:
+            validator.validate_raw(test_data_dir / "test_valid.cdf")
+        assert list(tmp_path.iterdir()) == []
+
+        # Enabled, a new validator reuses the response written by the first
+        with CDFValidator(cache_dir=tmp_path, use_cache=True) as validator:
+            assert (
+                validator.validate_raw(test_data_dir / "test_valid.cdf") == raw_response
+            )
+        assert len(list(tmp_path.iterdir())) == 1
+        with CDFValidator(cache_dir=tmp_path, use_cache=True) as validator:
+            assert (
+                validator.validate_raw(test_data_dir / "test_valid.cdf") == raw_response
+            )
+        assert m.call_count == 2
+
+
+def test_validator_default_cache_dir(monkeypatch):
+    """Test that the default cache directory is only resolved when it is used."""
+
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    with CDFValidator() as validator:
+        assert validator.cache_dir is None
+
+
+def test_validate_raw_no_home(monkeypatch):
+    """Test that caching without a home directory keeps responses in memory only."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    raw_response = "Global attribute issues:\n  Missing Descriptor\n"
+
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    with CDFValidator(use_cache=True) as validator:
+        with requests_mock.Mocker() as m:
+            m.post(validator.api_url, text=raw_response)
+            assert validator.validate_raw(test_data_dir / "test_valid.cdf") == (
+                raw_response
+            )
+            assert validator.validate_raw(test_data_dir / "test_valid.cdf") == (
+                raw_response
+            )
+            assert m.call_count == 1
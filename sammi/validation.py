@@ -1,6 +1,52 @@
+import hashlib
+import logging
+import os
 import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterable, List, NamedTuple, Optional, Tuple
+
 import requests
-from typing import List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of validation responses remembered per validator.
+_RESPONSE_CACHE_SIZE = 128
+
+
+def _file_digest(file_obj: BinaryIO) -> bytes:
+    """
+    Hash the content of a binary file in chunks, without reading it into memory at once.
+    """
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+, which hashes with the GIL released
+        digest = hashlib.file_digest(file_obj, lambda: hashlib.blake2b(digest_size=16))
+    else:
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: file_obj.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+class ValidationIssue(NamedTuple):
+    """
+    A single error reported by the SPDF validation API.
+
+    Converting it to a `str` gives "<section>: <message>".
+
+    Attributes
+    ----------
+    section : `str`
+        The section of the response the error was found in, e.g. "Global attribute issues" or the header of a variable without its trailing colon, e.g. "Variable Epoch".
+    message : `str`
+        The error message itself.
+    """
+
+    section: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.section}: {self.message}"
 
 
 class CDFValidator:
@@ -11,13 +57,63 @@ class CDFValidator:
     ----------
     api_url : `str`, optional
         The URL of the SPDF validation API. Default is "https://skteditor.heliophysics.net/cgi-bin/checkcdf.cgi".
+    timeout : `Tuple[float, float]`, optional
+        The connect and read timeouts, in seconds, for requests to the API. Default is (5, 120).
+    cache_dir : `pathlib.Path`, optional
+        Directory for cached API responses, used when ``use_cache`` is `True`.
+        Default is ``sammi/validation`` under ``$XDG_CACHE_HOME`` (or ``~/.cache``).
+    max_workers : `int`, optional
+        The maximum number of concurrent requests made by `validate_many`, which is also the number of connections kept open to the API. Default is 8.
+    use_cache : `bool`, optional
+        Whether to reuse the responses for files that were already validated, in memory and across processes in ``cache_dir``. Default is `False`.
     """
 
     def __init__(
         self,
         api_url: str = "https://skteditor.heliophysics.net/cgi-bin/checkcdf.cgi",
+        timeout: Tuple[float, float] = (5, 120),
+        cache_dir: Optional[pathlib.Path] = None,
+        max_workers: int = 8,
+        use_cache: bool = False,
     ):
         self.api_url = api_url
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+        # The default directory is only resolved once the cache is used
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else None
+        # Reuse one session so repeated uploads keep the TLS connection alive
+        self._session = requests.Session()
+        # Retry failed connections and transient gateway errors; other failures are
+        # reported straight away. An upload that timed out waiting for the response
+        # may already be in progress on the server, so read errors are not retried.
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["POST"],
+        )
+        # Keep a connection per worker so concurrent uploads are not discarded
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=max_workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Successful responses keyed on (file content digest, file name, api_url),
+        # shared by the validate_many workers
+        self._response_cache = {}
+        self._response_cache_lock = threading.Lock()
+
+    def __enter__(self) -> "CDFValidator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the HTTP session used to reach the SPDF validation API.
+        """
+        self._session.close()
 
     def validate(self, cdf_path: pathlib.Path) -> List[str]:
         """
@@ -39,6 +135,54 @@ class CDFValidator:
         except Exception as e:
             return [f"Validation failed: {str(e)}"]
 
+    def validate_structured(self, cdf_path: pathlib.Path) -> List[ValidationIssue]:
+        """
+        Function to validate a CDF file against the ISTP guidelines using the SPDF validation API, keeping the section of each error.
+
+        Parameters
+        ----------
+        cdf_path : `pathlib.Path`
+            The path to the local CDF file to validate.
+
+        Returns
+        -------
+        `List[ValidationIssue]`
+            A list of errors from the validation process, as (section, message) pairs.
+        """
+        try:
+            raw_response = self.validate_raw(cdf_path)
+            return self._parse_validation_issues(raw_response)
+        except Exception as e:
+            return [ValidationIssue("Validation failed", str(e))]
+
+    def validate_many(
+        self, cdf_paths: Iterable[pathlib.Path], max_workers: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Function to validate several CDF files against the ISTP guidelines using the SPDF validation API.
+
+        The uploads are sent concurrently, so the total time is bound by the slowest request rather than the sum of all of them.
+
+        Parameters
+        ----------
+        cdf_paths : `Iterable[pathlib.Path]`
+            The paths to the local CDF files to validate.
+        max_workers : `int`, optional
+            The maximum number of concurrent requests. Default is the validator's ``max_workers``.
+
+        Returns
+        -------
+        `List[List[str]]`
+            A list of error messages for each file, in the same order as ``cdf_paths``.
+        """
+        cdf_paths = list(cdf_paths)
+        if max_workers is None:
+            max_workers = self.max_workers
+        if len(cdf_paths) < 2:
+            return [self.validate(cdf_path) for cdf_path in cdf_paths]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(cdf_paths))) as pool:
+            return list(pool.map(self.validate, cdf_paths))
+
     def validate_raw(self, cdf_path: pathlib.Path) -> str:
         """
         Function to validate a CDF file against the ISTP guidelines using the SPDF validation API.
@@ -52,16 +196,102 @@ class CDFValidator:
         -------
         `str`
             The raw response from the SPDF validation API.
+
+        Notes
+        -----
+        With ``use_cache`` set, successful responses are remembered by the content and name of the file.
+        Validating the same file again then does not upload it, and the responses are also stored in ``cache_dir`` and reused across processes.
         """
-        try:
-            with open(cdf_path, "rb") as cdf_to_upload:
-                response = requests.post(
-                    self.api_url, files={"file": (cdf_path.name, cdf_to_upload)}
+        use_cache = self.use_cache
+        with open(cdf_path, "rb") as cdf_to_upload:
+            if use_cache:
+                # The key is content-addressed, so edited files are re-validated.
+                # The name is uploaded too, and the report may refer to it.
+                key = (_file_digest(cdf_to_upload), cdf_path.name, self.api_url)
+                cache_path = self._cache_path(key)
+                cached = self._cached_response(key, cache_path)
+                if cached is not None:
+                    return cached
+                cdf_to_upload.seek(0)
+
+            try:
+                response = self._session.post(
+                    self.api_url,
+                    files={"file": (cdf_path.name, cdf_to_upload)},
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
-                return response.content.decode("utf-8")
-        except requests.RequestException as e:
-            return f"API request failed: {str(e)}"
+                # Setting the encoding skips charset detection and decodes once
+                response.encoding = "utf-8"
+                result = response.text
+            except requests.RequestException as e:
+                return f"API request failed: {str(e)}"
+
+        if use_cache:
+            self._remember_response(key, result)
+        if use_cache and cache_path is not None:
+            # The cache is best-effort, e.g. the cache directory may be read-only
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # Unique per thread, as validate_many may write the same file twice
+                tmp_suffix = f"{os.getpid()}.{threading.get_ident()}.tmp"
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{tmp_suffix}")
+                tmp_path.write_text(result, encoding="utf-8")
+                # Swap the complete file into place so readers never see a partial one
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                logging.debug(f"Could not write validation cache file {cache_path}")
+        return result
+
+    def _cached_response(
+        self, key: Tuple[bytes, str, str], cache_path: Optional[pathlib.Path]
+    ) -> Optional[str]:
+        """
+        Look up a previous API response in memory, then on disk at ``cache_path``.
+        """
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+        if cached is None:
+            if cache_path is None:
+                return None
+            try:
+                cached = cache_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                # Missing or unreadable cache, ask the API
+                return None
+            self._remember_response(key, cached)
+        return cached
+
+    def _remember_response(self, key: Tuple[bytes, str, str], result: str) -> None:
+        """
+        Keep a successful API response in memory, dropping the oldest one when full.
+        """
+        with self._response_cache_lock:
+            if len(self._response_cache) >= _RESPONSE_CACHE_SIZE:
+                self._response_cache.pop(next(iter(self._response_cache)))
+            self._response_cache[key] = result
+
+    def _cache_path(self, key: Tuple[bytes, str, str]) -> Optional[pathlib.Path]:
+        """
+        Path of the on-disk cache file for a (file digest, file name, api_url) key.
+
+        Without a ``cache_dir``, and no home directory to put the default one in,
+        this is `None` and responses are only remembered in memory.
+        """
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            try:
+                cache_home = (
+                    os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+                )
+            except RuntimeError:
+                logging.debug("No home directory for the validation cache")
+                return None
+            cache_dir = pathlib.Path(cache_home) / "sammi" / "validation"
+        digest, file_name, api_url = key
+        name = hashlib.blake2b(digest, digest_size=16)
+        name.update(f"{file_name}\0{api_url}".encode("utf-8"))
+        return cache_dir / f"{name.hexdigest()}.txt"
 
     def _parse_errors(self, raw_response: str) -> List[str]:
         """
@@ -73,12 +303,56 @@ class CDFValidator:
         Returns:
             List[str]: A list of error messages extracted from the raw response.
         """
+        return [
+            f"{section}: {message}"
+            for section, message in self._split_errors(raw_response)
+        ]
+
+    def _parse_validation_issues(self, raw_response: str) -> List[ValidationIssue]:
+        """
+        Parses the raw response from the SPDF validation API to extract errors.
+
+        Args:
+            raw_response (str): The raw string response from the SPDF validation API.
+
+        Returns:
+            List[ValidationIssue]: A list of errors extracted from the raw response.
+        """
+        # Variable headers end in ":", which is not part of the section name
+        return [
+            ValidationIssue(section.removesuffix(":"), message)
+            for section, message in self._split_errors(raw_response)
+        ]
+
+    def _split_errors(self, raw_response: str) -> List[Tuple[str, str]]:
+        """
+        Parses the raw response from the SPDF validation API into the errors it reports.
+
+        The errors are plain tuples, with variable headers as they appear in the
+        response, so that `_parse_errors` can format them without constructing a
+        `ValidationIssue` for each.
+
+        Args:
+            raw_response (str): The raw string response from the SPDF validation API.
+
+        Returns:
+            List[Tuple[str, str]]: The (section, message) of each error in the raw response.
+        """
         errors = []
         current_section = None
 
         if raw_response.startswith("API request failed:"):
-            return [raw_response]
+            section, _, message = raw_response.partition(":")
+            return [(section, message.lstrip())]
 
+        # Errors are only collected inside a section, so skip the scan if none can open
+        if (
+            "Global attribute issues:" not in raw_response
+            and "Variable" not in raw_response
+        ):
+            return errors
+
+        append = errors.append
         for line in raw_response.splitlines():
             if "Global attribute issues:" in line:
                 current_section = "Global attribute issues"
@@ -86,12 +360,12 @@ class CDFValidator:
                 current_section = line.strip()
             elif "FAILED variable checks. Errors:" in line:
                 continue
-            elif current_section and line.strip() and "Warning" not in line:
-                errors.append(f"{current_section}: {line.strip()}")
-            elif current_section and not line.strip():
-                current_section = None
-
-        # Filter out any entries that are just section headers without actual errors
-        errors = [error for error in errors if not error.endswith(":")]
+            elif current_section:
+                line = line.strip()
+                if not line:
+                    current_section = None
+                # Lines ending in ":" are only headers without an actual error
+                elif "Warning" not in line and not line.endswith(":"):
+                    append((current_section, line))
 
         return errors